@@ -1,69 +1,216 @@
-import matplotlib
-matplotlib.use('Qt5Agg')
+import os
+import re
 import csv
 import json
-import os
 from datetime import datetime
-import matplotlib.pyplot as plt
 from collections import defaultdict
 import calendar
-import pandas as pd
+import math
+import numpy as np
+import orjson
+
+
+def _pyplot():
+    """Import pyplot on first use so non-plotting commands skip matplotlib"""
+    import matplotlib
+    matplotlib.use(os.environ.get('MPLBACKEND', 'Agg'))
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _sum_by_category(cat_codes, amounts, mask, ncat):
+    """Per-category totals over the rows selected by mask (None selects all rows)"""
+    if mask is None:
+        return np.bincount(cat_codes, weights=amounts, minlength=ncat)
+    return np.bincount(cat_codes[mask], weights=amounts[mask], minlength=ncat)
+
 
 class ExpenseTracker:
+    _NUM_RE = re.compile(r'[+-]?(\d+(\.\d*)?|\.\d+)')
+    _COLUMNS = ('_dates', '_desc', '_amounts', '_cat_codes')
+
     def __init__(self, data_file="expenses.csv", budget_file="budgets.json"):
         self.data_file = data_file
         self.budget_file = budget_file
-        self.expenses = []
         self.categories = [
             "Food", "Transportation", "Housing", "Entertainment", 
             "Utilities", "Healthcare", "Education", "Shopping", "Other"
         ]
+        self._cat_idx = {c: i for i, c in enumerate(self.categories)}
+        self._cat_names = np.array(self.categories, dtype=object)
+        self._OTHER = self._cat_idx['Other']
         self.category_budgets = {}
+        self._analysis_fig = None
+        self._trends_fig = None
+        self._actions = {
+            '1': self._cmd_add,
+            '2': self.view_expenses,
+            '3': self._cmd_view_category,
+            '4': self._cmd_summary,
+            '5': self.set_budgets,
+            '6': self._cmd_plot,
+            '7': self.spending_trends,
+            '8': self._cmd_report,
+            '9': self._cmd_export,
+            '10': self.clear_all_expenses,
+            '11': self.clear_all_budgets,
+        }
+        self._clear_columns()
         self.load_data()
         self.load_budgets()
 
     def load_data(self):
         """Load expense data from file"""
-        if os.path.exists(self.data_file):
-            with open(self.data_file, 'r') as f:
-                reader = csv.DictReader(f)
-                self.expenses = list(reader)  
-                for expense in self.expenses:
-                    expense['amount'] = float(expense['amount'])
-                    expense['date'] = datetime.strptime(expense['date'], "%Y-%m-%d %H:%M")
+        if os.path.exists(self.data_file) and os.path.getsize(self.data_file) > 0:
+            import pandas as pd
+            df = pd.read_csv(
+                self.data_file,
+                dtype={'amount': 'float64', 'description': 'string', 'category': 'category'},
+                parse_dates=['date'],
+                date_format="%Y-%m-%d %H:%M",
+                keep_default_na=False
+            ).astype({'date': 'datetime64[ns]'})
+            self._rebuild_columns(df)
+
+    def _clear_columns(self):
+        """Reset the column arrays to an empty expense list"""
+        self._dates = np.empty(0, dtype='datetime64[s]')
+        self._desc = np.empty(0, dtype=object)
+        self._amounts = np.empty(0, dtype=np.float64)
+        self._cat_codes = np.empty(0, dtype=np.int8)
+        self._buffers = {name: getattr(self, name) for name in self._COLUMNS}
+        self._monthly_cat_totals = defaultdict(float)
+        self._date_str_cache = {}
+
+    def _rebuild_columns(self, df):
+        """Materialize the column arrays from a parsed expense frame"""
+        import pandas as pd
+        self._date_str_cache = {}
+        dates = df['date']
+        self._dates = dates.to_numpy(dtype='datetime64[s]')
+        self._desc = df['description'].to_numpy(dtype=object)
+        self._amounts = df['amount'].to_numpy(dtype=np.float64)
+        codes = pd.Categorical(df['category'], categories=self.categories).codes
+        self._cat_codes = np.where(codes < 0, self._OTHER, codes).astype(np.int8)
+        self._buffers = {name: getattr(self, name) for name in self._COLUMNS}
+        
+        totals = pd.Series(self._amounts).groupby(
+            [self._cat_codes, dates.dt.month.to_numpy(), dates.dt.year.to_numpy()]
+        ).sum()
+        self._monthly_cat_totals = defaultdict(float, {
+            (self._cat_names[code], int(month), int(year)): total
+            for (code, month, year), total in totals.items()
+        })
+
+    def _grow_buffers(self, capacity):
+        """Reallocate the column buffers with room for capacity rows"""
+        n = self._amounts.size
+        for name in self._COLUMNS:
+            buf = np.empty(capacity, dtype=self._buffers[name].dtype)
+            buf[:n] = getattr(self, name)
+            self._buffers[name] = buf
+
+    def _append_columns(self, expense):
+        """Extend the column arrays with a single new expense"""
+        n = self._amounts.size
+        if n == self._buffers['_amounts'].size:
+            self._grow_buffers(max(16, 2 * n))
+            
+        date = expense['date']
+        row = (
+            np.datetime64(date, 's'), expense['description'],
+            expense['amount'], self._cat_idx[expense['category']]
+        )
+        for name, value in zip(self._COLUMNS, row):
+            buf = self._buffers[name]
+            buf[n] = value
+            setattr(self, name, buf[:n + 1])
+        self._monthly_cat_totals[(expense['category'], date.month, date.year)] += expense['amount']
+        self._date_str_cache = {}
+
+    def _date_mask(self, month=None, year=None):
+        """Boolean mask of expenses in the given month/year, or None when unfiltered"""
+        if month and not 1 <= month <= 12:
+            return np.zeros(self._dates.size, dtype=bool)
+        if year:
+            if month:
+                lo = np.datetime64(f'{year:04d}-{month:02d}', 'M')
+                hi = lo + np.timedelta64(1, 'M')
+            else:
+                lo = np.datetime64(f'{year:04d}', 'Y')
+                hi = lo + np.timedelta64(1, 'Y')
+            return (self._dates >= lo) & (self._dates < hi)
+        if month:
+            return self._dates.astype('datetime64[M]').astype(np.int64) % 12 == month - 1
+        return None
+
+    def _cached_date_strs(self, fmt):
+        """Return all expense dates formatted with fmt, memoized until the next insert"""
+        if fmt not in self._date_str_cache:
+            import pandas as pd
+            self._date_str_cache[fmt] = pd.Series(self._dates).dt.strftime(fmt).to_numpy(dtype=object)
+        return self._date_str_cache[fmt]
 
     def save_data(self):
         """Save expense data to file"""
         with open(self.data_file, 'w', newline='') as f:
-            fieldnames = ['date', 'description', 'category', 'amount']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for expense in self.expenses:
-                temp = expense.copy()
-                temp['date'] = temp['date'].strftime("%Y-%m-%d %H:%M")
-                writer.writerow(temp)
+            writer = csv.writer(f)
+            writer.writerow(['date', 'description', 'category', 'amount'])
+            writer.writerows(zip(
+                self._cached_date_strs("%Y-%m-%d %H:%M"), self._desc,
+                self._cat_names[self._cat_codes], self._amounts.tolist()
+            ))
+
+    def _append_row(self, expense):
+        """Append a single expense to the data file"""
+        need_header = not os.path.exists(self.data_file) or os.path.getsize(self.data_file) == 0
+        needs_newline = False
+        if not need_header:
+            with open(self.data_file, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+                
+        with open(self.data_file, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if need_header:
+                writer.writerow(['date', 'description', 'category', 'amount'])
+            elif needs_newline:
+                f.write(writer.dialect.lineterminator)
+            writer.writerow([
+                expense['date'].strftime("%Y-%m-%d %H:%M"),
+                expense['description'],
+                expense['category'],
+                expense['amount']
+            ])
 
     def load_budgets(self):
         """Load budget data from file"""
         if os.path.exists(self.budget_file):
             with open(self.budget_file, 'r') as f:
-                self.category_budgets = json.load(f)
+                budgets = json.load(f)
+            # Older files may hold NaN/Infinity (or null, once re-saved); drop them
+            self.category_budgets = {
+                category: budget for category, budget in budgets.items()
+                if isinstance(budget, (int, float)) and not isinstance(budget, bool)
+                and math.isfinite(budget)
+            }
 
     def save_budgets(self):
         """Save budget data to file"""
-        with open(self.budget_file, 'w') as f:
-            json.dump(self.category_budgets, f, indent=2)
+        with open(self.budget_file, 'wb') as f:
+            f.write(orjson.dumps(self.category_budgets, option=orjson.OPT_INDENT_2))
 
     def add_expense(self, description, category, amount):
         """Add a new expense"""
-        if category not in self.categories:
-            category = "Other"
+        code = self._cat_idx.get(category, self._OTHER)
+        category = self.categories[code]
             
-        try:
-            amount = float(amount)
-        except ValueError:
-            print("Invalid amount. Please enter a number.")
-            return
+        if isinstance(amount, str):
+            amount = amount.strip()
+            if not self._NUM_RE.fullmatch(amount):
+                print("Invalid amount. Please enter a number.")
+                return
+        amount = float(amount)
             
         expense = {
             'date': datetime.now(),
@@ -72,8 +219,8 @@ class ExpenseTracker:
             'amount': amount
         }
         
-        self.expenses.append(expense)
-        self.save_data()
+        self._append_columns(expense)
+        self._append_row(expense)
         print(f"Added expense: ${amount:.2f} for {description}")
         
         self.check_budget_alert(category, amount)
@@ -81,51 +228,44 @@ class ExpenseTracker:
     def view_expenses(self, filter_category=None, month=None, year=None):
         """View expenses with filters"""
         print("\n--- Expenses ---")
-        if not self.expenses:
+        if self._amounts.size == 0:
             print("No expenses recorded yet.")
             return
         
-        filtered = self.expenses
+        mask = self._date_mask(month, year)
+        if mask is None:
+            mask = np.ones(self._amounts.size, dtype=bool)
         
         if filter_category:
-            filtered = [e for e in filtered if e['category'] == filter_category]
+            mask &= self._cat_codes == self._cat_idx.get(filter_category, -1)
             
-        if month or year:
-            filtered = [e for e in filtered 
-                       if (not month or e['date'].month == month) 
-                       and (not year or e['date'].year == year)]
-            
-        if not filtered:
+        idxs = np.flatnonzero(mask)
+        if idxs.size == 0:
             print("No expenses match your filters.")
             return
             
-        for i, expense in enumerate(filtered, 1):
-            date_str = expense['date'].strftime("%Y-%m-%d")
-            print(f"{i}. {date_str} - {expense['description']} ({expense['category']}): ${expense['amount']:.2f}")
+        date_strs = self._cached_date_strs("%Y-%m-%d")[idxs]
+        for i, (idx, date_str) in enumerate(zip(idxs, date_strs), 1):
+            category = self.categories[self._cat_codes[idx]]
+            print(f"{i}. {date_str} - {self._desc[idx]} ({category}): ${self._amounts[idx]:.2f}")
         
-        total = sum(e['amount'] for e in filtered)
+        total = self._amounts[mask].sum()
         print(f"\nTotal: ${total:.2f}")
 
 
     def get_summary(self, month=None, year=None):
         """Generate expense summary by category with date filters"""
-        summary = defaultdict(float)
-        total = 0.0
+        mask = self._date_mask(month, year)
+        totals = _sum_by_category(self._cat_codes, self._amounts, mask, len(self.categories))
+        total = float(totals.sum())
         
-        for expense in self.expenses:
-            if month and expense['date'].month != month:
-                continue
-            if year and expense['date'].year != year:
-                continue
-                
-            summary[expense['category']] += expense['amount']
-            total += expense['amount']
+        summary = {self.categories[i]: float(totals[i]) for i in np.flatnonzero(totals)}
         
         return summary, total
 
     def show_summary(self, month=None, year=None):
         """Display expense summary with budget comparison"""
-        if not self.expenses:
+        if self._amounts.size == 0:
             print("No expenses to summarize.")
             return
             
@@ -154,11 +294,12 @@ class ExpenseTracker:
 
     def plot_expenses(self, month=None, year=None):
         """Create visualizations of expenses"""
-        if not self.expenses:
+        if self._amounts.size == 0:
             print("No expenses to visualize.")
             return
             
         summary, total = self.get_summary(month, year)
+        plt = _pyplot()
         
         labels = []
         sizes = []
@@ -170,68 +311,72 @@ class ExpenseTracker:
                 sizes.append(amount)
         
 
-        plt.figure(figsize=(14, 8))
+        if self._analysis_fig is None:
+            self._analysis_fig = plt.figure(figsize=(14, 8))
+        fig = self._analysis_fig
+        fig.clear()
+        ax1, ax2 = fig.subplots(1, 2)
         
-        plt.subplot(1, 2, 1)
-        plt.pie(sizes, labels=labels, autopct='%1.1f%%', 
+        ax1.pie(sizes, labels=labels, autopct='%1.1f%%', 
                 colors=colors[:len(labels)], startangle=140)
-        plt.axis('equal')
-        plt.title('Expense Distribution')
+        ax1.axis('equal')
+        ax1.set_title('Expense Distribution')
         
-        plt.subplot(1, 2, 2)
         categories = list(summary.keys())
-        actuals = [summary[cat] for cat in categories]
-        budgets = [self.category_budgets.get(cat, 0) for cat in categories]
+        actuals = np.fromiter((summary[cat] for cat in categories), float, len(categories))
+        budgets = np.array([self.category_budgets.get(cat, 0) for cat in categories], dtype=float)
         
-        x = range(len(categories))
+        x = np.arange(len(categories))
         bar_width = 0.35
         
-        plt.bar(x, actuals, width=bar_width, label='Actual', color='skyblue')
-        plt.bar([pos + bar_width for pos in x], budgets, width=bar_width, label='Budget', color='lightgreen')
+        ax2.bar(x - bar_width/2, actuals, bar_width, label='Actual', color='skyblue')
+        ax2.bar(x + bar_width/2, budgets, bar_width, label='Budget', color='lightgreen')
         
-        plt.xlabel('Categories')
-        plt.ylabel('Amount ($)')
-        plt.title('Actual vs Budgeted Spending')
-        plt.xticks([pos + bar_width/2 for pos in x], categories, rotation=45, ha='right')
-        plt.legend()
-        plt.tight_layout()
+        ax2.set_xlabel('Categories')
+        ax2.set_ylabel('Amount ($)')
+        ax2.set_title('Actual vs Budgeted Spending')
+        ax2.set_xticks(x)
+        ax2.set_xticklabels(categories, rotation=45, ha='right')
+        ax2.legend()
+        fig.tight_layout()
         
-        plt.savefig('expense_analysis.png')
+        fig.savefig('expense_analysis.png')
         print("Saved expense analysis to 'expense_analysis.png'")
-        plt.close()  
 
 
     def spending_trends(self):
         """Show monthly spending trends"""
-        if not self.expenses:
+        if self._amounts.size == 0:
             print("No expenses to analyze trends.")
             return
             
-        df = pd.DataFrame(self.expenses)
-        if not pd.api.types.is_datetime64_any_dtype(df['date']):
-            df['date'] = pd.to_datetime(df['date'])
-        df['month_year'] = df['date'].dt.strftime('%Y-%m')
+        months, codes = np.unique(self._dates.astype('datetime64[M]'), return_inverse=True)
+        month_labels = np.datetime_as_string(months, unit='M')
+        totals = np.bincount(codes, weights=self._amounts)
         
-        monthly = df.groupby('month_year')['amount'].sum().reset_index()
+        plt = _pyplot()
+        if self._trends_fig is None:
+            self._trends_fig = plt.figure(figsize=(12, 6))
+        fig = self._trends_fig
+        fig.clear()
+        ax = fig.subplots()
         
-        plt.figure(figsize=(12, 6))
-        plt.bar(monthly['month_year'], monthly['amount'], color='royalblue')
+        ax.bar(month_labels, totals, color='royalblue')
         
         if self.category_budgets:
             total_budget = sum(self.category_budgets.values())
-            plt.axhline(y=total_budget, color='r', linestyle='-', 
+            ax.axhline(y=total_budget, color='r', linestyle='-', 
                        label=f'Monthly Budget (${total_budget:.2f})')
-            plt.legend()
+            ax.legend()
         
-        plt.xlabel('Month')
-        plt.ylabel('Total Spending ($)')
-        plt.title('Monthly Spending Trends')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Total Spending ($)')
+        ax.set_title('Monthly Spending Trends')
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
         
-        plt.savefig('spending_trends.png')
+        fig.savefig('spending_trends.png')
         print("Saved spending trends to 'spending_trends.png'")
-        plt.close()  
 
     def set_budgets(self):
         """Set budgets for each category"""
@@ -240,9 +385,13 @@ class ExpenseTracker:
             current = self.category_budgets.get(category, 0)
             budget = input(f"Budget for {category} (current: ${current:.2f}): $")
             try:
-                self.category_budgets[category] = float(budget) if budget else 0
+                value = float(budget) if budget else 0
             except ValueError:
+                value = None
+            if value is None or not math.isfinite(value):
                 print("Invalid input. Budget not changed.")
+            else:
+                self.category_budgets[category] = value
         
         self.save_budgets()
         print("Budgets updated successfully!")
@@ -254,12 +403,7 @@ class ExpenseTracker:
             return
             
         now = datetime.now()
-        category_total = sum(
-            e['amount'] for e in self.expenses 
-            if e['category'] == category 
-            and e['date'].month == now.month 
-            and e['date'].year == now.year
-        )
+        category_total = self._monthly_cat_totals[(category, now.month, now.year)]
         
         if category_total > budget:
             print("\n" + "!" * 50)
@@ -274,56 +418,51 @@ class ExpenseTracker:
             month = month or now.month
             year = year or now.year
             
-        month_expenses = [
-            e for e in self.expenses 
-            if e['date'].month == month and e['date'].year == year
-        ]
-        
-        if not month_expenses:
+        mask = self._date_mask(month, year)
+        if not mask.any():
             print(f"No expenses for {calendar.month_name[month]} {year}")
             return
             
+        import pandas as pd
+        sub = pd.DataFrame({
+            'date': self._cached_date_strs("%Y-%m-%d")[mask],
+            'description': self._desc[mask],
+            'category': self._cat_names[self._cat_codes[mask]],
+            'amount': self._amounts[mask]
+        })
+        
         report = {
             "month": calendar.month_name[month],
             "year": year,
-            "total": sum(e['amount'] for e in month_expenses),
-            "by_category": defaultdict(float),
-            "expenses": []
+            "total": float(sub['amount'].sum()),
+            "by_category": sub.groupby('category', observed=True, sort=False)['amount'].sum().to_dict(),
+            "expenses": sub.to_dict('records')
         }
         
-        for e in month_expenses:
-            report["by_category"][e['category']] += e['amount']
-            report["expenses"].append({
-                "date": e['date'].strftime("%Y-%m-%d"),
-                "description": e['description'],
-                "category": e['category'],
-                "amount": e['amount']
-            })
-        
-        report["by_category"] = dict(report["by_category"])
-        
         filename = f"expense_report_{year}_{month}.json"
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             
         print(f"Monthly report saved to {filename}")
         return report
 
     def export_to_json(self, filename="expenses.json"):
         """Export expenses to JSON file"""
-        export_data = []
-        for expense in self.expenses:
-            temp = expense.copy()
-            temp['date'] = temp['date'].strftime("%Y-%m-%d %H:%M")
-            export_data.append(temp)
-            
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        export_data = [
+            {'date': date, 'description': desc, 'category': category, 'amount': amount}
+            for date, desc, category, amount in zip(
+                self._cached_date_strs("%Y-%m-%d %H:%M"), self._desc,
+                self._cat_names[self._cat_codes], self._amounts.tolist()
+            )
+        ]
+        
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
         print(f"Data exported to {filename}")
 
     def clear_all_expenses(self):
         """Delete all expenses from the tracker and file"""
-        self.expenses = []
+        self._clear_columns()
         self.save_data()
         print("All expenses have been cleared.")
 
@@ -333,6 +472,71 @@ class ExpenseTracker:
         self.save_budgets()
         print("All budgets have been cleared.")
 
+    def _prompt_category(self, prompt):
+        """Show the category menu and return the chosen category, or None if invalid"""
+        print("\nCategories:")
+        for i, category in enumerate(self.categories, 1):
+            print(f"{i}. {category}")
+            
+        cat_choice = input(prompt)
+        try:
+            return self.categories[int(cat_choice)-1]
+        except (ValueError, IndexError):
+            return None
+
+    def _prompt_month_year(self, month_prompt, year_prompt):
+        """Ask for an optional month and year; returns None on invalid input"""
+        month = input(month_prompt)
+        year = input(year_prompt)
+        try:
+            return (int(month) if month else None, int(year) if year else None)
+        except ValueError:
+            print("Invalid month/year format")
+            return None
+
+    def _cmd_add(self):
+        """Prompt for and add a new expense"""
+        print("\nAdd New Expense")
+        description = input("Description: ")
+        category = self._prompt_category("Choose category (1-9): ") or "Other"
+        amount = input("Amount: $")
+        self.add_expense(description, category, amount)
+
+    def _cmd_view_category(self):
+        """Prompt for a category and list its expenses"""
+        category = self._prompt_category("Choose category to view (1-9): ")
+        if category is None:
+            print("Invalid category selection")
+            return
+        self.view_expenses(filter_category=category)
+
+    def _cmd_summary(self):
+        """Prompt for a period and show the summary"""
+        period = self._prompt_month_year(
+            "Enter month (1-12, leave blank for all): ", "Enter year (YYYY, leave blank for all): "
+        )
+        if period:
+            self.show_summary(*period)
+
+    def _cmd_plot(self):
+        """Prompt for a period and plot the expense analysis"""
+        period = self._prompt_month_year(
+            "Enter month (1-12, leave blank for all): ", "Enter year (YYYY, leave blank for all): "
+        )
+        if period:
+            self.plot_expenses(*period)
+
+    def _cmd_report(self):
+        """Prompt for a month and generate its report"""
+        period = self._prompt_month_year("Enter month (1-12): ", "Enter year (YYYY): ")
+        if period:
+            self.monthly_report(*period)
+
+    def _cmd_export(self):
+        """Prompt for a filename and export expenses"""
+        filename = input("Enter filename (default: expenses.json): ") or "expenses.json"
+        self.export_to_json(filename)
+
     def run(self):
         """Main application loop"""
         while True:
@@ -352,88 +556,13 @@ class ExpenseTracker:
             
             choice = input("\nEnter your choice: ")
             
-            if choice == '1':
-                print("\nAdd New Expense")
-                description = input("Description: ")
-                
-                print("\nCategories:")
-                for i, category in enumerate(self.categories, 1):
-                    print(f"{i}. {category}")
-                    
-                cat_choice = input("Choose category (1-9): ")
-                try:
-                    category = self.categories[int(cat_choice)-1]
-                except:
-                    category = "Other"
-                    
-                amount = input("Amount: $")
-                self.add_expense(description, category, amount)
-                
-            elif choice == '2':
-                self.view_expenses()
-                
-            elif choice == '3':
-                print("\nCategories:")
-                for i, category in enumerate(self.categories, 1):
-                    print(f"{i}. {category}")
-                    
-                cat_choice = input("Choose category to view (1-9): ")
-                try:
-                    category = self.categories[int(cat_choice)-1]
-                    self.view_expenses(filter_category=category)
-                except:
-                    print("Invalid category selection")
-                    
-            elif choice == '4':
-                month = input("Enter month (1-12, leave blank for all): ")
-                year = input("Enter year (YYYY, leave blank for all): ")
-                try:
-                    self.show_summary(
-                        month=int(month) if month else None,
-                        year=int(year) if year else None
-                    )
-                except ValueError:
-                    print("Invalid month/year format")
-                    
-            elif choice == '5':
-                self.set_budgets()
-                
-            elif choice == '6':
-                month = input("Enter month (1-12, leave blank for all): ")
-                year = input("Enter year (YYYY, leave blank for all): ")
-                try:
-                    self.plot_expenses(
-                        month=int(month) if month else None,
-                        year=int(year) if year else None
-                    )
-                except ValueError:
-                    print("Invalid month/year format")
-                    
-            elif choice == '7':
-                self.spending_trends()
-                
-            elif choice == '8':
-                month = input("Enter month (1-12): ")
-                year = input("Enter year (YYYY): ")
-                try:
-                    self.monthly_report(month=int(month), year=int(year))
-                except ValueError:
-                    print("Invalid month/year format")
-                    
-            elif choice == '9':
-                filename = input("Enter filename (default: expenses.json): ") or "expenses.json"
-                self.export_to_json(filename)
-                
-            elif choice == '10':
-                self.clear_all_expenses()
-                
-            elif choice == '11':
-                self.clear_all_budgets()
-                
-            elif choice == '12':
+            if choice == '12':
                 print("Goodbye!")
                 break
                 
+            action = self._actions.get(choice)
+            if action:
+                action()
             else:
                 print("Invalid choice. Please try again.")
 